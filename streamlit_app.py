@@ -14,13 +14,32 @@ related articles from the loaded items.
 """
 
 import streamlit as st
+import sys
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
+
+
+@dataclass(frozen=True, slots=True)
+class NewsItem:
+    """An immutable news summary with its metadata."""
+
+    title: str
+    summary: str
+    source: str
+    link: str
+    lang: str
+    country: str
+    topics: tuple[str, ...]
+    # Precomputed bitmask of `topics` (see TOPIC_BIT), so that topic overlap
+    # tests are a single integer AND.
+    topicmask: int
 
 
 # Define a small sample dataset for demonstration purposes. Each item
 # represents a news summary with metadata. The `topics` field is a list of
 # keywords indicating the category of the article.
-SAMPLE_ITEMS = [
+_SAMPLE_DATA = [
     {
         "title": "Apple dévoile son nouveau casque de réalité mixte",
         "summary": "Apple a présenté un casque de réalité mixte qui combine réalité augmentée et réalité virtuelle.",
@@ -96,57 +115,145 @@ SAMPLE_ITEMS = [
 ]
 
 
-def fetch_news(lang: str, country: str, selected_topics: list[str]) -> list[dict]:
+# One bit per distinct topic in the dataset.
+TOPIC_BIT: dict[str, int] = {}
+for _raw in _SAMPLE_DATA:
+    for _topic in _raw['topics']:
+        TOPIC_BIT.setdefault(sys.intern(_topic), 1 << len(TOPIC_BIT))
+
+
+def _make_item(raw: dict) -> NewsItem:
+    """Build a NewsItem from raw data, interning the codes compared on every filter."""
+    topics = tuple(sys.intern(topic) for topic in raw['topics'])
+    topicmask = 0
+    for topic in topics:
+        topicmask |= TOPIC_BIT[topic]
+    return NewsItem(
+        title=raw['title'],
+        summary=raw['summary'],
+        source=raw['source'],
+        link=raw['link'],
+        lang=sys.intern(raw['lang']),
+        country=sys.intern(raw['country']),
+        topics=topics,
+        topicmask=topicmask,
+    )
+
+
+# Freeze the raw data into immutable, slotted records.
+SAMPLE_ITEMS = tuple(_make_item(_raw) for _raw in _SAMPLE_DATA)
+
+# Inverted indices mapping each language, country and topic to the indices of
+# the items carrying it. `fetch_news` intersects these instead of scanning
+# every item.
+ALL_INDICES = frozenset(range(len(SAMPLE_ITEMS)))
+_by_lang: dict[str, set[int]] = {}
+_by_country: dict[str, set[int]] = {}
+_by_topic: dict[str, set[int]] = {}
+for _i, _it in enumerate(SAMPLE_ITEMS):
+    _by_lang.setdefault(_it.lang, set()).add(_i)
+    _by_country.setdefault(_it.country, set()).add(_i)
+    for _topic in _it.topics:
+        _by_topic.setdefault(_topic, set()).add(_i)
+BY_LANG = {key: frozenset(indices) for key, indices in _by_lang.items()}
+BY_COUNTRY = {key: frozenset(indices) for key, indices in _by_country.items()}
+BY_TOPIC = {key: frozenset(indices) for key, indices in _by_topic.items()}
+
+# Sidebar option labels, built once rather than on every Streamlit rerun.
+LANG_OPTIONS = {
+    "fr": "Français",
+    "en": "English",
+}
+COUNTRY_OPTIONS = {
+    "both": "National et International",
+    "fr": "France",
+    "int": "International",
+}
+TOPIC_OPTIONS = {
+    "tech": "Tech",
+    "science": "Science",
+    "economy": "Économie",
+    "environnement": "Environnement",
+    "health": "Santé",
+}
+LANG_KEYS = tuple(LANG_OPTIONS)
+COUNTRY_KEYS = tuple(COUNTRY_OPTIONS)
+TOPIC_KEYS = tuple(TOPIC_OPTIONS)
+_format_lang = LANG_OPTIONS.__getitem__
+_format_country = COUNTRY_OPTIONS.__getitem__
+_format_topic = TOPIC_OPTIONS.__getitem__
+
+# Static footer content
+FOOTER_SEPARATOR = "---"
+FOOTER_CAPTION = (
+    "Les brèves sont mises à jour à 07 h et 18 h 30 (Fuseau Europe/Paris).\n"
+    "Version freemium : résumés avec publicité. Version premium : sans publicité et accès approfondi."
+)
+
+# For each article (keyed by its unique link), every other item sharing at
+# least one topic, in dataset order. The dataset is static, so this one-time
+# pass replaces the per-query scan in `find_related_articles`.
+RELATED_BY_LINK = {
+    _it.link: tuple(
+        _other for _other in SAMPLE_ITEMS
+        if _other is not _it and _it.topicmask & _other.topicmask
+    )
+    for _it in SAMPLE_ITEMS
+}
+
+# Agent reply fragments. Quoted titles are built once here instead of on every
+# chat turn.
+QUOTED_TITLES = {_it.title: f'« {_it.title} »' for _it in SAMPLE_ITEMS}
+SUGGESTIONS_PREFIX = "Voici d'autres articles qui pourraient vous intéresser : "
+NO_SUGGESTION_REPLY = "Je n'ai pas trouvé d'autres articles pertinents pour le moment."
+
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def fetch_news(lang: str, country: str, selected_topics: tuple[str, ...]) -> tuple[NewsItem, ...]:
     """Filter the SAMPLE_ITEMS based on language, country and topics.
 
+    Results are cached per preference tuple, so reloading with unchanged
+    preferences skips the filtering entirely.
+
     Args:
         lang: 'fr' or 'en'.
         country: 'fr', 'int' or 'both'.
-        selected_topics: list of topic strings.
+        selected_topics: sorted tuple of topic strings.
 
     Returns:
-        A list of news items matching the criteria. If no items match, returns an empty list.
+        A tuple of news items matching the criteria. If no items match, returns an empty tuple.
     """
-    results = []
-    for item in SAMPLE_ITEMS:
-        # Filter by language
-        if lang and item['lang'] != lang:
-            continue
-        # Filter by country
-        if country != 'both' and item['country'] != country:
-            continue
-        # Filter by topics
-        if selected_topics:
-            if not any(topic in item['topics'] for topic in selected_topics):
-                continue
-        results.append(item)
-    return results
-
-
-def find_related_articles(article: dict, all_items: list[dict], max_count: int = 3) -> list[str]:
+    # Bind globals and bound methods to locals once per call
+    intern = sys.intern
+    empty = frozenset()
+    lang = intern(lang)
+    country = intern(country)
+    candidates = BY_LANG.get(lang, empty) if lang else ALL_INDICES
+    if country != 'both':
+        candidates &= BY_COUNTRY.get(country, empty)
+    if selected_topics:
+        topic_index = BY_TOPIC.get
+        candidates &= empty.union(*[topic_index(intern(topic), empty) for topic in selected_topics])
+    return tuple(map(SAMPLE_ITEMS.__getitem__, sorted(candidates)))
+
+
+def find_related_articles(article: NewsItem, all_items: tuple[NewsItem, ...], max_count: int = 3) -> list[str]:
     """Find titles of other articles sharing at least one topic with the current article.
 
     Args:
-        article: The current article dictionary.
-        all_items: List of all available articles.
+        article: The current article.
+        all_items: Tuple of all available articles.
         max_count: Number of related titles to return.
 
     Returns:
         A list of up to `max_count` article titles.
     """
-    related = []
-    for item in all_items:
-        if item is article:
-            continue
-        # Check for overlap in topics
-        if set(item['topics']).intersection(article['topics']):
-            related.append(item['title'])
-        if len(related) >= max_count:
-            break
-    return related
-
-
-def generate_agent_response(user_query: str, article: dict, all_items: list[dict]) -> str:
+    loaded = {item.link for item in all_items}
+    related = (other.title for other in RELATED_BY_LINK[article.link] if other.link in loaded)
+    return list(islice(related, max_count))
+
+
+def generate_agent_response(user_query: str, article: NewsItem, all_items: tuple[NewsItem, ...]) -> str:
     """Generate a simple agent response based on the user query.
 
     The agent currently does not interpret the query; it only suggests other
@@ -164,9 +271,55 @@ def generate_agent_response(user_query: str, article: dict, all_items: list[dict
     """
     related_titles = find_related_articles(article, all_items)
     if related_titles:
-        suggestions = ' ; '.join(f'« {title} »' for title in related_titles)
-        return f"Voici d'autres articles qui pourraient vous intéresser : {suggestions}."
-    return "Je n'ai pas trouvé d'autres articles pertinents pour le moment."
+        return SUGGESTIONS_PREFIX + ' ; '.join(map(QUOTED_TITLES.__getitem__, related_titles)) + '.'
+    return NO_SUGGESTION_REPLY
+
+
+def _render_card(idx: int, item: NewsItem) -> bool:
+    """Render a news card and return whether its agent button was clicked."""
+    with st.container():
+        st.subheader(item.title)
+        st.write(item.summary)
+        st.caption(f"Source : {item.source}")
+        # Link to full article
+        st.markdown(f"[Lire la suite]({item.link})")
+        # Agent button
+        if not st.button("Agent Flashbriefs", key=f"agent-btn-{idx}"):
+            return False
+    st.session_state['chat_open'] = idx
+    # Initialize chat history for this article if not present, stored as
+    # parallel lists of roles (True for the user) and contents
+    st.session_state['chat_messages'].setdefault(idx, ([], []))
+    return True
+
+
+def _render_chat(idx: int, item: NewsItem, news: tuple[NewsItem, ...]) -> None:
+    """Render the agent chat for the open article and handle new questions."""
+    with st.expander("Discussion avec l'agent", expanded=True):
+        st.write(f"**{item.title}**")
+        st.write(item.summary)
+        # Display messages
+        roles, contents = st.session_state['chat_messages'][idx]
+        if roles:
+            for is_user, content in zip(roles, contents):
+                st.chat_message("user" if is_user else "assistant").markdown(content)
+        # Input field, batched in a form so typing does not trigger reruns
+        with st.form(f"chat-{idx}", clear_on_submit=True):
+            user_input = st.text_input(
+                "Posez votre question",
+                value="",
+                key=f"input-{idx}",
+                placeholder="Demandez plus de détails…",
+            )
+            submitted = st.form_submit_button("Envoyer")
+        if submitted and user_input:
+            # Append user message
+            roles.append(True)
+            contents.append(user_input)
+            # Generate agent response
+            reply = generate_agent_response(user_input, item, news)
+            roles.append(False)
+            contents.append(reply)
 
 
 def main():
@@ -174,89 +327,34 @@ def main():
     st.title("FlashBriefs – L'essentiel en 1 minute")
 
     # Initialize session state variables
-    if 'news' not in st.session_state:
-        st.session_state['news'] = []
-    if 'chat_messages' not in st.session_state:
-        st.session_state['chat_messages'] = {}
-    if 'chat_open' not in st.session_state:
-        st.session_state['chat_open'] = None  # Index of the article whose chat is open
+    ss = st.session_state
+    ss.setdefault('news', ())
+    ss.setdefault('chat_messages', {})
+    ss.setdefault('chat_open', None)  # Index of the article whose chat is open
 
     # Sidebar controls
     st.sidebar.header("Préférences")
-    lang = st.sidebar.selectbox("Langue", options=["fr", "en"], format_func=lambda x: "Français" if x == "fr" else "English")
-    country = st.sidebar.selectbox(
-        "Zone",
-        options=["both", "fr", "int"],
-        format_func=lambda x: "National et International" if x == "both" else ("France" if x == "fr" else "International"),
-    )
-    topic_options = {
-        "tech": "Tech",
-        "science": "Science",
-        "economy": "Économie",
-        "environnement": "Environnement",
-        "health": "Santé",
-    }
-    selected_topics = st.sidebar.multiselect("Sujets", options=list(topic_options.keys()), format_func=lambda x: topic_options[x])
+    lang = st.sidebar.selectbox("Langue", options=LANG_KEYS, format_func=_format_lang)
+    country = st.sidebar.selectbox("Zone", options=COUNTRY_KEYS, format_func=_format_country)
+    selected_topics = st.sidebar.multiselect("Sujets", options=TOPIC_KEYS, format_func=_format_topic)
 
     if st.sidebar.button("Charger les brèves"):
-        st.session_state['news'] = fetch_news(lang, country, selected_topics)
+        st.session_state['news'] = fetch_news(lang, country, tuple(sorted(selected_topics)))
         st.session_state['chat_open'] = None
         st.session_state['chat_messages'] = {}
 
-    # Display news cards
-    if st.session_state['news']:
-        for idx, item in enumerate(st.session_state['news']):
-            with st.container():
-                st.subheader(item['title'])
-                st.write(item['summary'])
-                st.caption(f"Source : {item['source']}")
-                # Link to full article
-                st.markdown(f"[Lire la suite]({item['link']})")
-                # Agent button
-                if st.button("Agent Flashbriefs", key=f"agent-btn-{idx}"):
-                    st.session_state['chat_open'] = idx
-                    # Initialize chat messages list for this article if not present
-                    if idx not in st.session_state['chat_messages']:
-                        st.session_state['chat_messages'][idx] = []
-
-                # Chat modal if this article's chat is open
-                if st.session_state['chat_open'] == idx:
-                    with st.expander("Discussion avec l'agent", expanded=True):
-                        st.write(f"**{item['title']}**")
-                        st.write(item['summary'])
-                        # Display messages
-                        messages = st.session_state['chat_messages'][idx]
-                        for m in messages:
-                            if m['role'] == 'user':
-                                st.markdown(f"<div style='text-align:right;color:var(--color-primary);'><strong>Vous :</strong> {m['content']}</div>", unsafe_allow_html=True)
-                            else:
-                                st.markdown(f"<div style='text-align:left;color:var(--color-secondary);'><strong>Agent :</strong> {m['content']}</div>", unsafe_allow_html=True)
-                        # Input field
-                        user_input = st.text_input(
-                            "Posez votre question",
-                            value="",
-                            key=f"input-{idx}",
-                            placeholder="Demandez plus de détails…",
-                        )
-                        if st.button("Envoyer", key=f"send-btn-{idx}") and user_input:
-                            # Append user message
-                            st.session_state['chat_messages'][idx].append({
-                                'role': 'user',
-                                'content': user_input,
-                            })
-                            # Generate agent response
-                            reply = generate_agent_response(user_input, item, st.session_state['news'])
-                            st.session_state['chat_messages'][idx].append({
-                                'role': 'agent',
-                                'content': reply,
-                            })
+    # Display news cards; only the card whose chat is open renders it
+    news = ss['news']
+    chat_open = ss['chat_open']
+    for idx, item in enumerate(news):
+        if _render_card(idx, item):
+            chat_open = idx
+        if chat_open == idx:
+            _render_chat(idx, item, news)
 
     # Footer
-    st.markdown("---")
-    st.caption(
-        "Les brèves sont mises à jour à 07 h et 18 h 30 (Fuseau Europe/Paris).\n"
-        "Version freemium : résumés avec publicité. Version premium : sans publicité et accès approfondi."
-    )
+    st.markdown(FOOTER_SEPARATOR)
+    st.caption(FOOTER_CAPTION)
 
 
 if __name__ == "__main__":